@@ -1,8 +1,10 @@
 from dataclasses import dataclass as orig_dataclass, is_dataclass
+import datetime as dt
 from enum import Enum, EnumType
 from functools import cache, wraps
 from importlib import import_module
-from itertools import chain
+from inspect import isclass
+from operator import attrgetter
 from pydantic import BaseModel as PydanticBaseModel, ConfigDict, computed_field
 from pydantic.fields import ComputedFieldInfo, FieldInfo
 from pydantic.json_schema import GenerateJsonSchema
@@ -13,28 +15,45 @@ from pydantic._internal._model_construction import ModelMetaclass, PydanticGener
 from pydantic._internal._utils import ClassAttribute
 from pydantic_core import PydanticUndefined
 import sys
-from types import UnionType
-from typing import Any, Dict, List, Optional, Sequence, Type, Union, cast, get_args, get_origin
+from types import MappingProxyType, ModuleType, UnionType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Set, Tuple, Type, Union, cast, get_args, \
+    get_origin
+
+
+__builtin_types = frozenset({
+    bool, bytes, float, int, str, dt.date, dt.datetime, dt.time, dt.timedelta, type(None)
+})
+
+
+# Generated pybind modules, keyed on the name of the python module they were generated from
+__pybind_modules: Dict[str, ModuleType] = {}
 
 
 class UnconvertableValue(Exception):
     pass
 
 
-def field_info_iter(model_class):
-    if is_dataclass(model_class):
-        for field_name, field in model_class.__dataclass_fields__.items():
-            yield field_name, field.type, field.default
-    elif issubclass(model_class, PydanticBaseModel):
-        if hasattr(model_class, "__has_pybind_impl__"):
-            for field_name, field in model_class.__pydantic_decorators__.computed_fields.items():
-                yield field_name, field.info.return_type, field.info.default
-            else:
-                for field_name, field in model_class.model_fields.items():
-                    yield field_name, field.annotation, field.default
+def field_info_iter(model_class) -> Tuple[Tuple[str, Type, Any], ...]:
+    # Resolved once per class and held on the class itself
+    field_info = model_class.__dict__.get("__pybind_field_info__")
+    if field_info is None:
+        if is_dataclass(model_class):
+            field_info = tuple((field_name, field.type, field.default)
+                               for field_name, field in model_class.__dataclass_fields__.items())
+        elif not issubclass(model_class, PydanticBaseModel):
+            return ()
+        elif hasattr(model_class, "__has_pybind_impl__"):
+            field_info = tuple((field_name, field.info.return_type, field.info.default)
+                               for field_name, field in model_class.__pydantic_decorators__.computed_fields.items())
+        else:
+            field_info = tuple((field_name, field.annotation, field.default)
+                               for field_name, field in model_class.model_fields.items())
+
+        model_class.__pybind_field_info__ = field_info
+
+    return field_info
 
 
-@cache
 def get_pybind_type(typ: Union[Enum, ModelMetaclass]) -> Union[EnumType, Type]:
     """
     Return the generated pybind type corresponding to the BaseNodel-derived type
@@ -43,15 +62,25 @@ def get_pybind_type(typ: Union[Enum, ModelMetaclass]) -> Union[EnumType, Type]:
     :return: The corresponding, generated pybind type
     """
 
-    package_parts = typ.__module__.split(".")
-    pybind_module_name = "_".join(package_parts)
-    pybind_module = ".".join(chain(package_parts[:-1], ["__pybind__", pybind_module_name]))
+    # Held on the class itself, so hot paths pay an attribute load rather than a cache lookup
+    pybind_type = typ.__dict__.get("__pybind_type__")
+    if pybind_type is not None:
+        return pybind_type
 
-    module = sys.modules.get(pybind_module)
+    module = __pybind_modules.get(typ.__module__)
     if not module:
-        module = import_module(pybind_module)
+        package, _, _ = typ.__module__.rpartition(".")
+        pybind_module_name = typ.__module__.replace(".", "_")
+        pybind_module = f"{package}.__pybind__.{pybind_module_name}" if package else f"__pybind__.{pybind_module_name}"
+
+        module = sys.modules.get(pybind_module)
+        if not module:
+            module = import_module(pybind_module)
 
-    return getattr(module, typ.__name__)
+        __pybind_modules[typ.__module__] = module
+
+    pybind_type = typ.__pybind_type__ = getattr(module, typ.__name__)
+    return pybind_type
 
 
 def get_pybind_value(obj):
@@ -65,49 +94,160 @@ def get_pybind_value(obj):
 
 
 def _get_pybind_value(obj, default_to_self: bool = True):
-    if isinstance(obj, Enum):
-        return get_pybind_type(type(obj)).__entries[obj.name][0]
-    elif is_dataclass(obj) or isinstance(obj, PydanticBaseModel):
-        typ = type(obj)
-        pybind_type = get_pybind_type(typ)
-        name_iter = (name for name, _, _ in field_info_iter(typ))
-
-        if hasattr(typ, "__has_pybind_impl__"):
-            return pybind_type(**{name: getattr(obj.pybind_impl, name) for name in name_iter})
-        else:
-            return pybind_type(**{name: _get_pybind_value(getattr(obj, name)) for name in name_iter})
+    typ = type(obj)
+    if default_to_self and typ in __builtin_types:
+        return obj
+
+    to_pybind = _value_to_pybind_converter(typ)
+    if to_pybind:
+        return to_pybind(obj)
     elif default_to_self:
         return obj
     else:
         raise UnconvertableValue("Only builtins, dataclasses and pydantic classes supported")
 
 
+@cache
+def _value_to_pybind_converter(typ: Type) -> Optional[Callable[[Any], Any]]:
+    # Resolve the conversion for a value's runtime type once, rather than re-testing isinstance/is_dataclass per value
+    if issubclass(typ, Enum):
+        return lambda obj: _pybind_enum_values(typ)[obj.name]
+    elif hasattr(typ, "__has_pybind_impl__") or is_dataclass(typ) or issubclass(typ, PydanticBaseModel):
+        return _to_pybind_fn(typ)
+    else:
+        return None
+
+
+def _to_pybind_fn(typ) -> Callable[[Any], Any]:
+    # Generate the conversion for a dataclass or pydantic model, with the read of each field unrolled. The fields of a
+    # pybind-backed class are already pybind values, so are copied from its pybind_impl as they are
+    has_pybind_impl = hasattr(typ, "__has_pybind_impl__")
+    namespace = {"typ": typ, "get_pybind_type": get_pybind_type}
+    kwargs = []
+
+    for idx, (name, _, to_pybind, _) in enumerate(_field_spec(typ)):
+        if has_pybind_impl:
+            kwargs.append(f"{name}=pybind_impl.{name}")
+        elif to_pybind is _identity:
+            kwargs.append(f"{name}=obj.{name}")
+        else:
+            namespace[f"to_pybind_{idx}"] = to_pybind
+            kwargs.append(f"{name}=to_pybind_{idx}(obj.{name})")
+
+    lines = ["def to_pybind(obj):"]
+    if has_pybind_impl:
+        lines.append("    pybind_impl = obj._pybind_impl")
+
+    lines.append(f"    return get_pybind_type(typ)({', '.join(kwargs)})")
+
+    exec("\n".join(lines), namespace)
+    return namespace["to_pybind"]
+
+
+@cache
+def _pybind_enum_values(typ: EnumType) -> Dict[str, Any]:
+    return {name: entry[0] for name, entry in get_pybind_type(typ).__entries.items()}
+
+
 def from_pybind_value(value, typ: Type):
-    origin = get_origin(typ)
-    args = get_args(typ)
+    if type(value) in __builtin_types:
+        return value
 
-    if origin is Optional:
-        typ = args[0]
-        args = get_args(typ)
+    return _from_pybind_converter(typ)(value)
 
-    if origin in (Union, UnionType):
-        typ = next(a for a in args if a.__name__ == type(value).__name__)
 
-    is_dc_or_pydantic = is_dataclass(typ) or issubclass(typ, PydanticBaseModel)
+def _identity(value):
+    return value
 
-    if issubclass(typ, Enum):
-        return typ[value.name]
-    elif is_dc_or_pydantic:
-        if hasattr(typ, "__has_pybind_impl__"):
-            return typ(__pybind_impl__=value)
-        else:
-            # This is quite inefficient
-            kwargs = {}
-            for field_name, field_type, _ in field_info_iter(typ):
-                kwargs[field_name] = from_pybind_value(getattr(value, field_name), field_type)
-            return typ(**kwargs)
+
+def _has_pybind_type(typ) -> bool:
+    return isclass(typ) and (issubclass(typ, (Enum, PydanticBaseModel)) or is_dataclass(typ))
+
+
+@cache
+def _from_pybind_converter(typ) -> Callable[[Any], Any]:
+    # Resolve the conversion for a declared field type once, rather than on every attribute access
+    if get_origin(typ) in (Union, UnionType):
+        # The pybind value's type identifies which member of the union it is. Those types are resolved on first use,
+        # as the generated module need not be importable when the class declaring the union is defined
+        args = tuple(arg for arg in get_args(typ) if _has_pybind_type(arg))
+        if not args:
+            return _identity
+
+        converters = {}
+
+        def from_pybind(value):
+            if not converters:
+                converters.update((get_pybind_type(arg), _from_pybind_converter(arg)) for arg in args)
+
+            return converters.get(type(value), _identity)(value)
+
+        return from_pybind
+    elif not isclass(typ):
+        return _identity
+    elif issubclass(typ, Enum):
+        members = typ.__members__
+        return lambda value: members[value.name]
+    elif issubclass(typ, BaseModel):
+        return typ.from_pybind_impl
+    elif hasattr(typ, "__has_pybind_impl__"):
+        return lambda value: typ(__pybind_impl__=value)
+    elif is_dataclass(typ) or issubclass(typ, PydanticBaseModel):
+        return _from_pybind_fn(typ)
     else:
-        return value
+        return _identity
+
+
+def _from_pybind_fn(typ) -> Callable[[Any], Any]:
+    # Generate the conversion for a plain dataclass or pydantic model, with the read of each field unrolled
+    namespace = {"typ": typ}
+    kwargs = []
+
+    for idx, (name, _, _, from_pybind) in enumerate(_field_spec(typ)):
+        if from_pybind is _identity:
+            kwargs.append(f"{name}=value.{name}")
+        else:
+            namespace[f"from_pybind_{idx}"] = from_pybind
+            kwargs.append(f"{name}=from_pybind_{idx}(value.{name})")
+
+    exec(f"def from_pybind(value):\n    return typ({', '.join(kwargs)})", namespace)
+    return namespace["from_pybind"]
+
+
+@cache
+def _to_pybind_converter(typ) -> Callable[[Any], Any]:
+    # Resolve the conversion for a declared field type once. Values of exactly the declared type go straight to its
+    # converter, anything else (None for an Optional, a subclass, a union member) takes the general path
+    if not isclass(typ):
+        return _get_pybind_value
+    elif typ in __builtin_types:
+        return _identity
+
+    to_pybind = _value_to_pybind_converter(typ)
+    if to_pybind is None:
+        return _get_pybind_value
+
+    return lambda value: to_pybind(value) if type(value) is typ else _get_pybind_value(value)
+
+
+def _field_spec(typ) -> Tuple[Tuple[str, Type, Callable[[Any], Any], Callable[[Any], Any]], ...]:
+    # (name, type, to_pybind, from_pybind) for each field, computed once per class. Classes created via BaseModel or
+    # dataclass have this attached at creation; plain dataclasses and pydantic models get it on first conversion.
+    # Names are interned, as they are used for every attribute and kwargs lookup against the pybind object
+    spec = typ.__dict__.get("__pybind_field_spec__")
+    if spec is None:
+        spec = typ.__pybind_field_spec__ = tuple((sys.intern(name), field_type, _to_pybind_converter(field_type),
+                                                  _from_pybind_converter(field_type))
+                                                 for name, field_type, _ in field_info_iter(typ))
+
+    return spec
+
+
+# The FieldInfo attributes which carry over to a ComputedFieldInfo, and getters reading each set of attributes in one
+# call. Single underscore, as these are used in a class body
+_shared_field_info_slots = tuple(set(FieldInfo.__slots__).intersection(ComputedFieldInfo.__slots__))
+_shared_field_info_values = attrgetter(*_shared_field_info_slots)
+_computed_field_info_values = attrgetter(*ComputedFieldInfo.__slots__)
 
 
 @slots_dataclass
@@ -120,13 +260,13 @@ class PropertyFieldInfo(ComputedFieldInfo):
 
     @classmethod
     def from_computed_field_info(cls, info: ComputedFieldInfo, default=PydanticUndefined):
-        kwargs = {s: getattr(info, s) for s in info.__slots__}
+        kwargs = dict(zip(ComputedFieldInfo.__slots__, _computed_field_info_values(info)))
         kwargs["default"] = default
         return PropertyFieldInfo(**kwargs)
 
     @classmethod
     def from_field_info(cls, info: FieldInfo, wrapped_property: property):
-        kwargs = {s: getattr(info, s) for s in set(info.__slots__).intersection(ComputedFieldInfo.__slots__)}
+        kwargs = dict(zip(_shared_field_info_slots, _shared_field_info_values(info)))
         kwargs["wrapped_property"] = wrapped_property
         kwargs["default"] = info.default
         kwargs["return_type"] = info.annotation
@@ -134,12 +274,19 @@ class PropertyFieldInfo(ComputedFieldInfo):
 
 
 def to_title(snake_str: str) -> str:
-    return " ".join(word.title() for word in snake_str.split("_"))
+    return snake_str.replace("_", " ").title()
 
 
 def _getter(name: str, typ: Union[EnumType, Type]):
+    name = sys.intern(name)
+    from_pybind = _from_pybind_converter(typ)
+
+    if from_pybind is _identity:
+        # Nothing to convert, so read through the pybind instance without a Python-level frame
+        return attrgetter(f"_pybind_impl.{name}")
+
     def fn(self):
-        return from_pybind_value(getattr(self.pybind_impl, name), typ)
+        return from_pybind(getattr(self._pybind_impl, name))
 
     fn.__name__ = name
     fn.__annotations__ = {"return": typ}
@@ -148,8 +295,11 @@ def _getter(name: str, typ: Union[EnumType, Type]):
 
 
 def _setter(name: str, typ: Union[EnumType, Type]):
+    name = sys.intern(name)
+    to_pybind = _to_pybind_converter(typ)
+
     def fn(self, value: Any):
-        setattr(self.pybind_impl, name, _get_pybind_value(value))
+        setattr(self._pybind_impl, name, to_pybind(value))
 
     fn.__name__ = name
     fn.__annotations__ = {"value": typ}
@@ -157,6 +307,65 @@ def _setter(name: str, typ: Union[EnumType, Type]):
     return fn
 
 
+class PybindField(property):
+    # Redirects a field to the corresponding attribute of the instance's pybind_impl. Subclassing property keeps
+    # access on the C-level descriptor path; property subclasses assign __doc__ on init, hence the slot
+
+    __slots__ = ("__doc__",)
+
+    def __init__(self, name: str, typ: Union[EnumType, Type]):
+        super().__init__(fget=_getter(name, typ), fset=_setter(name, typ))
+        self.__doc__ = ""
+
+
+def _missing_required(cls, kwargs: Dict[str, Any]) -> List[str]:
+    return [name for name, _, required, _ in cls.__pybind_init_spec__ if required and name not in kwargs]
+
+
+def _init_fn(cls):
+    # Generate an __init__ with the field handling for cls unrolled, in the manner of dataclasses. Instances of
+    # subclasses which define their own __init__ and call up to this one take the general BaseModel.__init__
+    lines = ["def __init__(self, **kwargs):",
+             "    if type(self) is not cls:",
+             "        return base_init(self, **kwargs)",
+             "    pybind_impl = kwargs.pop('__pybind_impl__', None)",
+             "    if pybind_impl is None:"]
+    namespace = {"cls": cls, "base_init": BaseModel.__init__, "BaseModel": BaseModel, "undefined": PydanticUndefined,
+                 "get_pybind_type": get_pybind_type, "missing_required": _missing_required,
+                 "required_fields": cls.__pybind_required_fields__}
+
+    for idx, (name, alias, _, to_pybind) in enumerate(cls.__pybind_init_spec__):
+        if to_pybind is _identity and not alias:
+            # Present or not, kwargs already holds what the pybind type needs
+            continue
+
+        lines.append(f"        value = kwargs.get({name!r}, undefined)")
+        if alias:
+            lines.append("        if value is undefined:")
+            lines.append(f"            value = kwargs.pop({alias!r}, undefined)")
+
+        lines.append("        if value is not undefined:")
+        if to_pybind is _identity:
+            lines.append(f"            kwargs[{name!r}] = value")
+        else:
+            namespace[f"to_pybind_{idx}"] = to_pybind
+            lines.append(f"            kwargs[{name!r}] = to_pybind_{idx}(value)")
+
+    lines += ["        if not required_fields.issubset(kwargs):",
+              "            raise RuntimeError(f'Missing required fields: {missing_required(cls, kwargs)}')",
+              "        pybind_impl = get_pybind_type(cls)(**kwargs)",
+              "    object.__setattr__(self, '_pybind_impl', pybind_impl)",
+              "    super(BaseModel, self).__init__()"]
+
+    exec("\n".join(lines), namespace)
+    fn = namespace["__init__"]
+    fn.__qualname__ = f"{cls.__qualname__}.__init__"
+    fn.__module__ = cls.__module__
+    fn.__pybind_generated__ = True
+
+    return fn
+
+
 class ModelMetaclassNoCopy(ModelMetaclass):
     def __new__(
             mcs,
@@ -175,11 +384,9 @@ class ModelMetaclassNoCopy(ModelMetaclass):
             # Rewrite annotations as properties, with getters and setters which interact with the attributes
             # on the generated pybind_impl class
 
-            properties = {}
-
-            for name, typ in annotations.items():
+            for name, typ in tuple(annotations.items()):
                 value = namespace.get(name, PydanticUndefined)
-                field = computed_field(property(fget=_getter(name, typ), fset=_setter(name, typ)))
+                field = computed_field(PybindField(name, typ), return_type=typ)
                 if isinstance(value, FieldInfo):
                     field_infos[name] = value
                     field.decorator_info = PropertyFieldInfo.from_field_info(value,
@@ -189,15 +396,27 @@ class ModelMetaclassNoCopy(ModelMetaclass):
                     field_infos[name] = FieldInfo(annotation=typ, default=value)
 
                 field.decorator_info.title = to_title(name)
-                properties[name] = field
-
-            for name, prop in properties.items():
                 annotations.pop(name)
-                namespace[name] = prop
+                namespace[name] = field
 
         cls = cast(ModelMetaclass, super().__new__(mcs, cls_name, bases, namespace, **kwargs))
         cls.__has_pybind_impl__ = True
         cls.__pydantic_decorators__.__annotations__["computed_fields"] = dict[str, Decorator[PropertyFieldInfo]]
+        cls.__pybind_field_spec__ = _field_spec(cls)
+        # Shared by every instance, so exposed read-only
+        cls.__pybind_computed_fields__ = MappingProxyType(
+            {name: field.info for name, field in cls.__pydantic_decorators__.computed_fields.items()})
+        cls.__pybind_init_spec__ = tuple(
+            (name, field.info.alias, field.info.required, to_pybind)
+            for (name, field), (_, _, to_pybind, _) in zip(cls.__pydantic_decorators__.computed_fields.items(),
+                                                            _field_spec(cls)))
+        cls.__pybind_required_fields__ = frozenset(name for name, _, required, _ in cls.__pybind_init_spec__
+                                                   if required)
+        if "__init__" not in namespace and \
+                (cls.__init__ is BaseModel.__init__ or getattr(cls.__init__, "__pybind_generated__", False)):
+            # Never replace a custom __init__ inherited from a base
+            cls.__init__ = _init_fn(cls)
+
         cls.__signature__ = ClassAttribute(
             '__signature__', generate_model_signature(cls.__init__, field_infos, config_wrapper)
         )
@@ -208,7 +427,7 @@ class ModelMetaclassNoCopy(ModelMetaclass):
 def json_schema_extra(schema: Dict[str, Any], model_class: ModelMetaclassNoCopy) -> None:
     generator = GenerateJsonSchema(by_alias=True)
     definitions: List[Dict] = model_class.__pydantic_core_schema__["definitions"]
-    definition = next(d for d in definitions if d["cls"] == model_class)
+    definition = next(d for d in definitions if d.get("cls") is model_class)
     computed_schema = definition["schema"]["computed_fields"]
     schema.pop("additionalProperties", None)
     properties = schema["properties"]
@@ -216,11 +435,11 @@ def json_schema_extra(schema: Dict[str, Any], model_class: ModelMetaclassNoCopy)
 
     for field in computed_schema:
         property_name = field["property_name"]
-        alias = field["alias"]
+        alias = field.get("alias", property_name)
         field_schema = generator.computed_field_schema(field)
         property_info = model_class.__pydantic_decorators__.computed_fields[property_name].info
 
-        if property_info.default == PydanticUndefined:
+        if property_info.default is PydanticUndefined:
             required.append(alias)
         else:
             field_schema["default"] = property_info.default
@@ -239,60 +458,76 @@ class BaseModel(PydanticBaseModel, metaclass=ModelMetaclassNoCopy):
     model_config = ConfigDict(json_schema_extra=json_schema_extra)
 
     @property
-    def model_computed_fields(self) -> dict[str, PropertyFieldInfo]:
-        return cast(dict[str, PropertyFieldInfo], super().model_computed_fields)
+    def model_computed_fields(self) -> Mapping[str, PropertyFieldInfo]:
+        return type(self).__pybind_computed_fields__
 
     @property
     def pybind_impl(self):
-        return self.__pybind_impl
+        return self._pybind_impl
 
     def to_msg_pack(self):
-        return self.__pybind_impl.to_msg_pack()
+        return self._pybind_impl.to_msg_pack()
 
     @classmethod
     def from_msg_pack(cls, data: Sequence[int]):
-        return _from_msg_pack(cls, data)
+        pybind_impl, _error_code = get_pybind_type(cls).from_msg_pack(data)
+        return cls.from_pybind_impl(pybind_impl)
+
+    @classmethod
+    def from_pybind_impl(cls, pybind_impl):
+        """
+        Construct an instance around an existing pybind object, which it will share. The pybind type has already
+        enforced the field types, so pydantic validation and __init__ are skipped
+
+        :param pybind_impl: An instance of the generated pybind type for this class
+        :return: A new instance of this class
+        """
+        ret = cls.__new__(cls)
+        object.__setattr__(ret, "_pybind_impl", pybind_impl)
+        object.__setattr__(ret, "__pydantic_fields_set__", set())
+        object.__setattr__(ret, "__pydantic_extra__", None)
+
+        if cls.__pydantic_post_init__:
+            ret.model_post_init(None)
+        else:
+            object.__setattr__(ret, "__pydantic_private__", None)
+
+        return ret
 
     def __init__(self, **kwargs):
         __pybind_impl__ = kwargs.pop("__pybind_impl__", None)
-        if __pybind_impl__:
-            self.__pybind_impl = __pybind_impl__
+        if __pybind_impl__ is not None:
+            object.__setattr__(self, "_pybind_impl", __pybind_impl__)
         else:
-            missing_required = []
-
-            for name, field_info in self.model_computed_fields.items():
-                value = kwargs.get(name, PydanticUndefined)
-                if value == PydanticUndefined:
-                    if field_info.alias:
-                        value = kwargs.get(field_info.alias, PydanticUndefined)
+            cls = type(self)
+            undefined = PydanticUndefined
 
-                    if value == PydanticUndefined:
-                        if field_info.required:
-                            missing_required.append(name)
-                    else:
-                        kwargs.pop(name)
-                        kwargs[field_info.alias] = value
+            for name, alias, _, to_pybind in cls.__pybind_init_spec__:
+                value = kwargs.get(name, undefined)
+                if value is undefined and alias:
+                    value = kwargs.pop(alias, undefined)
 
-                if value != PydanticUndefined:
-                    kwargs[name] = _get_pybind_value(value)
+                if value is not undefined:
+                    kwargs[name] = to_pybind(value)
 
-            if missing_required:
-                raise RuntimeError(f"Missing required fields: {missing_required}")
+            if not cls.__pybind_required_fields__.issubset(kwargs):
+                raise RuntimeError(f"Missing required fields: {_missing_required(cls, kwargs)}")
 
-            pybind_type = get_pybind_type(type(self))
-            object.__setattr__(self, "_BaseModel__pybind_impl", pybind_type(**kwargs))
+            object.__setattr__(self, "_pybind_impl", get_pybind_type(cls)(**kwargs))
 
         super().__init__()
 
 
     @property
     def __dict__(self):
-        return {name: from_pybind_value(getattr(self, name), typ) for name, typ, _ in field_info_iter(type(self))}
+        pybind_impl = self._pybind_impl
+        return {name: from_pybind(getattr(pybind_impl, name))
+                for name, _, _, from_pybind in type(self).__pybind_field_spec__}
 
     @__dict__.setter
     def __dict__(self, value: dict):
         try:
-            object.__getattribute__(self, "_BaseModel__pybind_impl")
+            object.__getattribute__(self, "_pybind_impl")
             for name, value in value.items():
                 object.__setattr__(self, name, value)
         except AttributeError:
@@ -302,17 +537,42 @@ class BaseModel(PydanticBaseModel, metaclass=ModelMetaclassNoCopy):
 def __dataclass_init(init):
     @wraps(init)
     def wrapper(self, *args, __pybind_impl__=None, **kwargs):
-        if __pybind_impl__:
-            self.__pybind_impl = __pybind_impl__
+        if __pybind_impl__ is not None:
+            object.__setattr__(self, "_pybind_impl", __pybind_impl__)
         else:
-            self.__pybind_impl = get_pybind_type(type(self))()
+            object.__setattr__(self, "_pybind_impl", get_pybind_type(type(self))())
             init(self, *args, **kwargs)
 
     return wrapper
 
 
+def __inherited_slots(cls) -> Set[str]:
+    # As dataclasses._add_slots, the slots already provided by the bases, which must not be declared again
+    slots = set()
+    for base in cls.__mro__[1:-1]:
+        base_slots = base.__dict__.get("__slots__", ())
+        slots.update((base_slots,) if isinstance(base_slots, str) else base_slots)
+        if "__weakref__" in base.__dict__:
+            slots.add("__weakref__")
+
+    return slots
+
+
+def __dataclass_slots(cls, weakref_slot: bool):
+    # Field values live on the pybind object, so the only per-instance state needed is the pybind_impl reference
+    cls_dict = {k: v for k, v in cls.__dict__.items() if k not in ("__dict__", "__weakref__")}
+    slots = ("_pybind_impl", "__weakref__") if weakref_slot else ("_pybind_impl",)
+    inherited_slots = __inherited_slots(cls)
+    cls_dict["__slots__"] = tuple(s for s in slots if s not in inherited_slots)
+
+    ret = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    ret.__qualname__ = cls.__qualname__
+
+    return ret
+
+
 def to_msg_pack(self):
-    return self.pybind_impl.to_msg_pack()
+    return self._pybind_impl.to_msg_pack()
 
 
 @classmethod
@@ -320,21 +580,38 @@ def from_msg_pack(cls, data: Sequence[int]):
     return _from_msg_pack(cls, data)
 
 
+pybind_impl = property(fget=lambda self: self._pybind_impl)
+
+
 def dataclass(cls=None, /, *, init=True, repr=True, eq=True, order=False,
               unsafe_hash=False, frozen=False, match_args=True,
               kw_only=False, slots=False, weakref_slot=False):
 
-    ret = orig_dataclass(cls, init=init, repr=repr, eq=eq, order=order, unsafe_hash=unsafe_hash, frozen=frozen,
-                         match_args=match_args, kw_only=kw_only, slots=slots, weakref_slot=weakref_slot)
+    def wrap(cls):
+        ret = orig_dataclass(cls, init=init, repr=repr, eq=eq, order=order, unsafe_hash=unsafe_hash, frozen=frozen,
+                             match_args=match_args, kw_only=kw_only)
 
-    for name, field in ret.__dataclass_fields__.items():
-        setattr(cls, name, property(fget=_getter(name, field.type), fset=_setter(name, field.type)))
+        if slots:
+            ret = __dataclass_slots(ret, weakref_slot)
+        elif weakref_slot:
+            raise TypeError("weakref_slot is True but slots is False")
 
-    ret.__init__ = __dataclass_init(ret.__init__)
-    ret.__has_pybind_impl__ = True
+        own_annotations = ret.__dict__.get("__annotations__", {})
+        for name, field in ret.__dataclass_fields__.items():
+            if name not in own_annotations and isinstance(getattr(ret, name, None), PybindField):
+                # Inherited from a pydantic_bind dataclass, whose field already redirects to pybind_impl
+                continue
 
-    ret.to_msg_pack = to_msg_pack
-    ret.from_msg_pack = from_msg_pack
-    ret.pybind_impl = property(fget=lambda self: self.__pybind_impl)
+            setattr(ret, name, PybindField(name, field.type))
 
-    return ret
+        ret.__init__ = __dataclass_init(ret.__init__)
+        ret.__has_pybind_impl__ = True
+        ret.__pybind_field_spec__ = _field_spec(ret)
+
+        ret.to_msg_pack = to_msg_pack
+        ret.from_msg_pack = from_msg_pack
+        ret.pybind_impl = pybind_impl
+
+        return ret
+
+    return wrap if cls is None else wrap(cls)
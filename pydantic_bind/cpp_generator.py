@@ -1,18 +1,20 @@
 from argparse import ArgumentParser
 from collections.abc import Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import MISSING, is_dataclass
 import datetime as dt
 from enum import Enum, EnumType
+from functools import cache, partial
 from itertools import chain
 from importlib import import_module
-from inspect import isclass
 from pathlib import Path
 from pydantic import BaseModel as PydanticBaseModel
 from pydantic._internal._model_construction import ModelMetaclass
 from pydantic_core import PydanticUndefined
 from textwrap import TextWrapper
 from types import UnionType
-from typing import Any, Optional, Set, Tuple, Union, get_args, get_origin
+from typing import Any, Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Set, TextIO, Tuple, Union, get_args, \
+    get_origin
 
 from pydantic_bind.base import BaseModel, field_info_iter
 
@@ -27,115 +29,235 @@ __base_type_mappings = {
     dt.timedelta: ("std::chrono::duration", "<chrono>")
 }
 
-__no_move_types = {
+# cpp_type results for the base types, built once
+__base_cpp_types = {
+    typ: (cpp_typ, frozenset((include,) if include else ()), frozenset())
+    for typ, (cpp_typ, include) in __base_type_mappings.items()
+}
+
+__no_move_types = frozenset({
     bool, float, int, dt.date, dt.datetime, dt.time, dt.timedelta
+})
+
+__module_to_path = str.maketrans(".", "/")
+
+# The mapping types which both pybind11/stl.h and msgpack.h can convert, and their includes
+__map_type_includes = {
+    "std::unordered_map": "<unordered_map>",
+    "std::map": "<map>"
 }
 
+DEFAULT_MAP_TYPE = "std::unordered_map"
+
 NoneT = type(None)
 
 
+def __str_default(value: str) -> str:
+    return f'"{value}"'
+
+
+def __enum_default(value: Enum) -> str:
+    return f"{type(value).__name__}::{value.name}"
+
+
+def __sequence_default(value) -> str:
+    return f'{{{", ".join([cpp_default(v) for v in value])}}}'
+
+
+def __mapping_default(value: dict) -> str:
+    items_str = [f"{{{cpp_default(k)}, {cpp_default(v)}}}" for k, v in value.items()]
+    return f'{{ {", ".join(items_str)} }}'
+
+
+# Exact default value type -> the function formatting it as a C++ initialiser
+__default_formatters = {
+    str: __str_default,
+    int: str,
+    float: str,
+    list: __sequence_default,
+    set: __sequence_default,
+    tuple: __sequence_default,
+    dict: __mapping_default
+}
+
+
 def cpp_default(value: Any) -> str | None:
-    if value in (MISSING, PydanticUndefined):
+    if value is MISSING or value is PydanticUndefined:
         return None
     elif value is None:
         return "std::nullopt"
-    elif isinstance(value, bool):
-        return "true" if value else "false"
+    elif value is True:
+        return "true"
+    elif value is False:
+        return "false"
+
+    formatter = __default_formatters.get(type(value))
+    if formatter:
+        return formatter(value)
     elif isinstance(value, str):
-        return f'"{value}"'
+        return __str_default(value)
     elif isinstance(value, Enum):
-        return f"{type(value).__name__}::{value.name}"
+        return __enum_default(value)
     elif isinstance(value, (int, float)):
         return str(value)
     elif isinstance(value, (list, set, tuple)):
-        return f'{{{", ".join(cpp_default(v) for v in value)}}}'
+        return __sequence_default(value)
     elif isinstance(value, dict):
-        items_str = (f"{{{cpp_default(k)}, {cpp_default(v)}}}" for k, v in value.items())
-        return f'{{ {", ".join(items_str)} }}'
+        return __mapping_default(value)
     else:
         raise RuntimeError(f"Unsupported default value {value}")
 
 
-def cpp_type(typ) -> Tuple[str, Set[str], Set[str]]:
-    def args_type(base_type: str) -> Tuple[str, Set[str], Set[str]]:
-        optional = False
-        real_args = ()
+def __args_type(base_type: str, args: Tuple, map_type: str) -> Tuple[str, FrozenSet[str], FrozenSet[str]]:
+    optional = False
+    real_args = ()
 
-        for arg in args:
-            if arg is NoneT:
-                optional = True
-            else:
-                real_args += (arg,)
+    for arg in args:
+        if arg is NoneT:
+            optional = True
+        else:
+            real_args += (arg,)
 
-        arg_types = ()
-        all_arg_usings = set()
-        all_arg_includes = {f"<{base_type.replace('std::', '')}>"}
-        if optional:
-            all_arg_includes.add("<optional>")
+    arg_types = ()
+    all_arg_usings = set()
+    all_arg_includes = {f"<{base_type.replace('std::', '')}>"}
+    if optional:
+        all_arg_includes.add("<optional>")
 
-        for arg in real_args:
-            arg_type, arg_includes, arg_usings = cpp_type(arg)
-            arg_types += (arg_type,)
-            all_arg_includes.update(arg_includes)
-            all_arg_usings.update(arg_usings)
+    for arg in real_args:
+        arg_type, arg_includes, arg_usings = cpp_type(arg, map_type)
+        arg_types += (arg_type,)
+        all_arg_includes.update(arg_includes)
+        all_arg_usings.update(arg_usings)
 
-        args_cpp_type = arg_types[0] if len(arg_types) == 1 else f"{base_type}<{', '.join(arg_types)}>"
+    args_cpp_type = arg_types[0] if len(arg_types) == 1 else f"{base_type}<{', '.join(arg_types)}>"
 
-        return f"std::optional<{args_cpp_type}>" if optional else args_cpp_type, all_arg_includes, all_arg_usings
+    return f"std::optional<{args_cpp_type}>" if optional else args_cpp_type, frozenset(all_arg_includes), \
+        frozenset(all_arg_usings)
 
-    dot = r'.'
-    slash = r'/'
-    base_cpp_type, include = __base_type_mappings.get(typ, (None, None))
-    if base_cpp_type:
-        return base_cpp_type, {include} if include else set(), set()
+
+def __union_type(args: Tuple, map_type: str) -> Tuple[str, FrozenSet[str], FrozenSet[str]]:
+    return __args_type("std::variant", args, map_type)
+
+
+def __sequence_type(args: Tuple, map_type: str) -> Tuple[str, FrozenSet[str], FrozenSet[str]]:
+    cpp_typ, includes, usings = cpp_type(args[0], map_type)
+    return f"std::vector<{cpp_typ}>", includes.union(("<vector>",)), usings
+
+
+def __set_type(args: Tuple, map_type: str) -> Tuple[str, FrozenSet[str], FrozenSet[str]]:
+    cpp_typ, includes, usings = cpp_type(args[0], map_type)
+    return f"std::set<{cpp_typ}>", includes.union(("<set>",)), usings
+
+
+def __tuple_type(args: Tuple, map_type: str) -> Tuple[str, FrozenSet[str], FrozenSet[str]]:
+    if Ellipsis in args:
+        if len(args) != 2 or args[1] is not Ellipsis:
+            raise RuntimeError("Cannot support Ellipsis/Any as a tuple parameter type")
+
+        # We've got something like Tuple[int, ...], treat it as a vector
+        return __sequence_type(args, map_type)
     else:
-        origin = get_origin(typ)
-        args = get_args(typ)
-
-        if origin is None:
-            if typ in (dict, list, set, tuple):
-                if args:
-                    origin = typ
-                else:
-                    raise RuntimeError(f"Cannot use non parameterised collection {typ} as a type")
-            elif issubclass(typ, PydanticBaseModel) or is_dataclass(typ) or issubclass(typ, Enum):
-                using = "::".join(chain(typ.__module__.split('.')[:-1], (typ.__name__,)))
-                return typ.__name__, {f'"{typ.__module__.replace(dot, slash)}.h"'}, {using}
-            else:
-                raise RuntimeError(f"Can only use builtins, datetime or BaseModel-derived types, not {typ}")
-
-        if origin is Optional:
-            cpp_typ, includes, usings = cpp_type(args[0])
-            return f"std::optional<{cpp_typ}>", includes.union(("optional",)), usings
-        elif origin in (Union, UnionType):
-            return args_type("std::variant")
-        elif origin in (list, Sequence):
-            cpp_typ, includes, usings = cpp_type(args[0])
-            return f"std::vector<{cpp_typ}>", includes.union(("vector",)), usings
-        elif origin is set:
-            cpp_typ, includes, usings = cpp_type(args[0])
-            return f"std::set<{cpp_typ}>", includes.union(("set",)), usings
-        elif origin is tuple:
-            if Ellipsis in args:
-                if len(args) != 2 or args[1] is not Ellipsis:
-                    raise RuntimeError("Cannot support Ellipsis/Any as a tuple parameter type")
-
-                # We've got something like Tuple[int, ...], treat it as a vector
-                cpp_typ, includes, usings = cpp_type(args[0])
-                return f"std::vector<{cpp_typ}>", includes.union(("vector",)), usings
+        # An actual tuple
+        return __args_type("std::tuple", args, map_type)
+
+
+def __map_type_include(map_type: str) -> str:
+    include = __map_type_includes.get(map_type)
+    if include is None:
+        raise RuntimeError(f"Unsupported map type {map_type}, must be one of {', '.join(__map_type_includes)}")
+
+    return include
+
+
+def __mapping_type(args: Tuple, map_type: str) -> Tuple[str, FrozenSet[str], FrozenSet[str]]:
+    if len(args) != 2:
+        raise RuntimeError(f"Mappings need key and value types, not {args}")
+
+    key_type, key_includes, key_usings = cpp_type(args[0], map_type)
+    value_type, value_includes, value_usings = cpp_type(args[1], map_type)
+    return f"{map_type}<{key_type}, {value_type}>", \
+        key_includes.union(value_includes, (__map_type_include(map_type),)), key_usings.union(value_usings)
+
+
+# Generic origin -> the function generating its C++ type from the type arguments
+__origin_cpp_types = {
+    Union: __union_type,
+    UnionType: __union_type,
+    list: __sequence_type,
+    Sequence: __sequence_type,
+    set: __set_type,
+    tuple: __tuple_type,
+    dict: __mapping_type,
+    Mapping: __mapping_type
+}
+
+
+@cache
+def cpp_type(typ, map_type: str = DEFAULT_MAP_TYPE) -> Tuple[str, FrozenSet[str], FrozenSet[str]]:
+    # Results are cached per type, so the include and using sets are returned frozen
+    base_cpp_type = __base_cpp_types.get(typ)
+    if base_cpp_type:
+        return base_cpp_type
+
+    origin = get_origin(typ)
+    args = get_args(typ)
+
+    if origin is None:
+        if typ in (dict, list, set, tuple):
+            if args:
+                origin = typ
             else:
-                # An actual tuple
-                return args_type("std::tuple")
-        elif origin in (dict, Mapping):
-            key_type, key_includes, key_usings = cpp_type(args[0])
-            value_type, value_includes, value_usings = cpp_type(args[0])
-            return f"std::unordered_map<{key_type}, {value_type}>", \
-                key_includes.union(value_includes).union("unordered_map", ), key_usings.union(value_usings)
+                raise RuntimeError(f"Cannot use non parameterised collection {typ} as a type")
+        elif isinstance(typ, (ModelMetaclass, EnumType)) or is_dataclass(typ):
+            using = "::".join(chain(typ.__module__.split('.')[:-1], (typ.__name__,)))
+            return typ.__name__, frozenset((f'"{typ.__module__.translate(__module_to_path)}.h"',)), frozenset((using,))
         else:
-            raise RuntimeError(f"Cannot handle type {typ}")
+            raise RuntimeError(f"Can only use builtins, datetime or BaseModel-derived types, not {typ}")
+
+    origin_cpp_type = __origin_cpp_types.get(origin)
+    if origin_cpp_type is None:
+        raise RuntimeError(f"Cannot handle type {typ}")
+
+    return origin_cpp_type(args, map_type)
+
+
+@cache
+def __text_wrapper(initial_indent: str, subsequent_indent: str, width: int) -> TextWrapper:
+    return TextWrapper(break_long_words=False, initial_indent=initial_indent, subsequent_indent=subsequent_indent,
+                       width=width)
+
+
+@cache
+def __constructor_fields(model_class: ModelMetaclass) -> Tuple[Tuple[str, Any, Optional[str]], ...]:
+    # (name, type, C++ default) for each field, in constructor order. Non-defaulted params must come first. They have
+    # always been emitted in reverse, which is kept so the generated constructor and msgpack field order are unchanged
+    required_fields = []
+    defaulted_fields = []
+
+    for name, field_type, default in field_info_iter(model_class):
+        default = cpp_default(default)
+        (defaulted_fields if default else required_fields).append((name, field_type, default))
 
+    required_fields.reverse()
+    return tuple(chain(required_fields, defaulted_fields))
 
-def class_attrs(model_class: ModelMetaclass):
+
+class ClassAttrs(NamedTuple):
+    names: List[str]
+    constructor_args: List[str]
+    init_args: List[str]
+    default_init_args: List[str]
+    base_init: Dict[type, Tuple[str, ...]]
+    types: List[str]
+    kwargs: List[str]
+    struct_members: List[str]
+    pydantic_attrs: List[str]
+    includes: Set[str]
+    usings: Set[str]
+
+
+def class_attrs(model_class: ModelMetaclass, map_type: str = DEFAULT_MAP_TYPE) -> ClassAttrs:
     types = []
     kwargs = []
     constructor_args = []
@@ -147,28 +269,24 @@ def class_attrs(model_class: ModelMetaclass):
 
     frozen = model_class.__dataclass_params__.frozen if is_dataclass(model_class) else \
         model_class.model_config.get("frozen")
-    pydantic_def = ".def_readonly" if frozen else ".def_readwrite"
+    attr_prefix = f'{".def_readonly" if frozen else ".def_readwrite"}("'
+    attr_member = f'", &{model_class.__name__}::'
+    no_move_types = __no_move_types
     all_includes = {'"msgpack/msgpack.h"'}
     all_usings = set()
     bases = [b for b in model_class.__bases__
              if b not in (BaseModel, PydanticBaseModel) and issubclass(b, BaseModel)
              and b.__pydantic_decorators__.computed_fields]
-    base_field_names = set(chain.from_iterable((n for n, _, _ in field_info_iter(b)) for b in bases))
+    base_init = {b: tuple(n for n, _, _ in __constructor_fields(b)) for b in bases}
+    base_field_names = set(chain.from_iterable(base_init.values()))
     needs_default_constructor = False
 
-    for name, field_type, default in field_info_iter(model_class):
-        typ, includes, usings = cpp_type(field_type)
+    for name, field_type, default in __constructor_fields(model_class):
+        typ, includes, usings = cpp_type(field_type, map_type)
         all_includes.update(includes)
         all_usings.update(usings)
 
-        try:
-            move = field_type not in __no_move_types and not issubclass(field_type, Enum)
-        except TypeError:
-            move = False
-
-        default = cpp_default(default)
-        position = len(types) if default else 0  # Need to ensure non-defaulted params are first
-        names.insert(position, name)
+        move = field_type not in no_move_types and not isinstance(field_type, EnumType)
 
         default_suffix = ""
         if default:
@@ -176,95 +294,91 @@ def class_attrs(model_class: ModelMetaclass):
         else:
             needs_default_constructor = True
 
-        constructor_args.insert(position, f"{typ} {name + default_suffix}")
-        kwargs.insert(position, f'py::arg("{name}")' + default_suffix)
-        types.insert(position, typ)
+        names.append(name)
+        constructor_args.append(f"{typ} {name + default_suffix}")
+        kwargs.append(f'py::arg("{name}")' + default_suffix)
+        types.append(typ)
 
         if name not in base_field_names:
-            init_args.insert(position, f"{name}({name if not move else f'std::move({name})'})")
-            default_init_args.insert(position, f"{name}({default or ''})")
-            struct_members.insert(position, f"{typ} {name};")
-            pydantic_attrs.insert(position, f'{pydantic_def}("{name}", &{model_class.__name__}::{name})')
+            init_args.append(f"{name}({name if not move else f'std::move({name})'})")
+            default_init_args.append(f"{name}({default or ''})")
+            struct_members.append(f"{typ} {name};")
+            pydantic_attrs.append(f"{attr_prefix}{name}{attr_member}{name})")
 
-    base_init = {b: class_attrs(b)[0] for b in bases}
-    return names, constructor_args, init_args, default_init_args if needs_default_constructor else [], base_init, \
-        types, kwargs, struct_members, pydantic_attrs, all_includes, all_usings
+    return ClassAttrs(names, constructor_args, init_args, default_init_args if needs_default_constructor else [],
+                      base_init, types, kwargs, struct_members, pydantic_attrs, all_includes, all_usings)
 
 
-def generate_class(model_class: ModelMetaclass, indent_size: int = 0, max_width: int = 110) -> \
-        Tuple[Optional[str], Optional[str], Optional[Set[str]], Optional[Set[str]]]:
+@cache
+def generate_class(model_class: ModelMetaclass, indent_size: int = 0, max_width: int = 110,
+                   map_type: str = DEFAULT_MAP_TYPE) -> \
+        Tuple[Optional[str], Optional[str], Optional[FrozenSet[str]], Optional[FrozenSet[str]]]:
+    # Results are cached per class, so the include and using sets are returned frozen
 
     names, constructor_args, init_args, default_init_args, base_init, types, kwargs, struct_members, pydantic_attrs, \
-        all_includes, all_usings = class_attrs(model_class)
+        all_includes, all_usings = class_attrs(model_class, map_type)
 
     if not types:
         return None, None, None, None
 
     cls_name = model_class.__name__
     bases = f" : public {', '.join(b.__name__ for b in base_init.keys())}" if base_init else ""
-    default_constructor = ""
-    default_pydantic_init = ""
     indent = " " * indent_size
+    member_indent = f"    {indent}"
     newline = "\n"
-    newline_indent = f"{newline}    {indent}"
     init_indent = " " * (indent_size + 8)
-    init_wrapper = TextWrapper(break_long_words=False, initial_indent=init_indent, subsequent_indent=init_indent,
-                               width=max_width)
+    init_wrapper = __text_wrapper(init_indent, init_indent, max_width)
     args_indent = " " * (indent_size + 5 + len(cls_name))
-    args_wrapper = TextWrapper(break_long_words=False, subsequent_indent=args_indent, width=max_width)
+    args_wrapper = __text_wrapper("", args_indent, max_width)
 
-    if default_init_args:
-        default_constructor = f"{indent}{cls_name}() :\n"
-        default_pydantic_init = f"{indent}.def(py::init<>())\n{indent}"
+    # Build each definition as a list of lines, joined once at the end. Runs of fixed lines are folded together
+    constructor_body = f"{member_indent}{{{newline}{member_indent}}}"
+    struct_lines = [f"{indent}struct {cls_name}{bases}", f"{indent}{{"]
+    pydantic_bases = ", " + ", ".join(base.__name__ for base in base_init.keys()) if base_init else ""
+    pydantic_lines = [f'{indent}py::class_<{cls_name}{pydantic_bases}>(m, "{cls_name}")']
 
+    if default_init_args:
+        struct_lines.append(f"{member_indent}{cls_name}() :")
         if base_init:
-            default_constructor += \
-                f"{indent}        " + \
-                f"{(',        ' + newline + indent).join(base.__name__ + '()' for base in base_init.keys())}" + \
-                "," + newline
-
-        default_constructor += "\n".join(init_wrapper.wrap(', '.join(default_init_args)))
-        default_constructor += f"""
-    {indent}{{
-    {indent}}}
-    
-    """
+            default_bases = (',        ' + newline + indent).join(base.__name__ + '()' for base in base_init.keys())
+            struct_lines.append(f"{indent}        {default_bases},")
 
-    base_init_str = ""
+        struct_lines += (newline.join(init_wrapper.wrap(", ".join(default_init_args))),
+                         f"{constructor_body}{newline}    ")
+        pydantic_lines.append(f"{member_indent}.def(py::init<>())")
+
+    struct_lines.append(f"{member_indent}{cls_name}({newline.join(args_wrapper.wrap(', '.join(constructor_args)))}) :")
     if base_init:
-        base_init_str = f"        {indent}" + \
-                        f"""{(',' + newline + indent).join(base.__name__ + '(' + ', '.join(args) + ')'
-                                                           for base, args in base_init.items())},{newline}"""
-
-    struct_def = f"""{indent}struct {cls_name}{bases}
-{indent}{{
-    {default_constructor}{indent}{cls_name}({newline.join(args_wrapper.wrap(', '.join(constructor_args)))}) :
-{base_init_str}{newline.join(init_wrapper.wrap(', '.join(init_args)))}
-    {indent}{{
-    {indent}}}
-
-    {indent}{newline_indent.join(struct_members)}
-    
-    {indent}MSGPACK_DEFINE({newline.join(args_wrapper.wrap(', '.join(names)))});
-{indent}}};"""
+        base_inits = (',' + newline + indent).join(f"{base.__name__}({', '.join(args)})"
+                                                    for base, args in base_init.items())
+        struct_lines.append(f"        {indent}{base_inits},")
 
-    pydantic_bases = ", " + ", ".join(base.__name__ for base in base_init.keys()) if base_init else ""
-    pydantic_init = "\n".join(args_wrapper.wrap(f"{', '.join(types)}>(), {', '.join(kwargs)}"))
-    pydantic_def = f"""{indent}py::class_<{cls_name}{pydantic_bases}>(m, "{cls_name}")
-    {default_pydantic_init}{indent}.def(py::init<{pydantic_init})
-    {indent}.def("to_msg_pack", &{cls_name}::to_msg_pack)
-    {indent}.def_static("from_msg_pack", &{cls_name}::from_msg_pack<{cls_name}>)
-    {indent}{newline_indent.join(pydantic_attrs)};"""
+    struct_lines += (newline.join(init_wrapper.wrap(", ".join(init_args))),
+                     f"{constructor_body}{newline}",
+                     f"{member_indent}{(newline + member_indent).join(struct_members)}",
+                     "    ",
+                     f"{member_indent}MSGPACK_DEFINE({newline.join(args_wrapper.wrap(', '.join(names)))});",
+                     f"{indent}}};")
+
+    pydantic_init = newline.join(args_wrapper.wrap(f"{', '.join(types)}>(), {', '.join(kwargs)}"))
+    pydantic_lines += (f"{member_indent}.def(py::init<{pydantic_init})",
+                       f'{member_indent}.def("to_msg_pack", &{cls_name}::to_msg_pack)',
+                       f'{member_indent}.def_static("from_msg_pack", &{cls_name}::from_msg_pack<{cls_name}>)',
+                       f"{member_indent}{(newline + member_indent).join(pydantic_attrs)};")
 
-    return struct_def, pydantic_def, all_includes, all_usings
+    struct_def = newline.join(struct_lines)
+    pydantic_def = newline.join(pydantic_lines)
 
+    return struct_def, pydantic_def, frozenset(all_includes), frozenset(all_usings)
 
+
+@cache
 def generate_enum(enum_typ: EnumType, indent_size: int = 0, max_width: int = 110) -> Tuple[str, str]:
     name = enum_typ.__name__
     indent = " " * indent_size
     args_indent = indent * 2
     newline_indent = f"\n{args_indent}"
-    args_wrapper = TextWrapper(break_long_words=False, subsequent_indent=args_indent, width=max_width)
+    args_wrapper = __text_wrapper("", args_indent, max_width)
 
     items = (f"{i.name} = {i.value}" for i in enum_typ)
     enum_def = "\n".join(args_wrapper.wrap(f"""{indent}enum class {name} {{ {', '.join(items)} }};"""))
@@ -276,8 +390,18 @@ def generate_enum(enum_typ: EnumType, indent_size: int = 0, max_width: int = 110
     return enum_def, pydantic_def
 
 
-def generate_module(module_name: str, output_dir: str, indent_size: int = 4, max_width: int = 110):
-    dot = r"."
+def __write_definitions(file: TextIO, definitions: Iterable[str], separator: str):
+    for idx, definition in enumerate(definitions):
+        if idx:
+            file.write(separator)
+
+        file.write(definition)
+
+
+def generate_module(module_name: str, output_dir: str, indent_size: int = 4, max_width: int = 110,
+                    map_type: str = DEFAULT_MAP_TYPE):
+    __map_type_include(map_type)
+
     slash = r"/"
     indent = " " * indent_size
     single_newline = "\n"
@@ -288,7 +412,7 @@ def generate_module(module_name: str, output_dir: str, indent_size: int = 4, max
     generated_root = Path(output_dir)
     module_root = module.__name__.split('.')[-0]
     module_base_name = module.__name__.split('.')[-1]
-    self_include = f'"{module_name.replace(dot, slash)}.h"'
+    self_include = f'"{module_name.translate(__module_to_path)}.h"'
     include_root = "/".join(module_name.split(".")[:-1])
     qualified_module_name = "_".join(module.__name__.split('.')[:-1]) + "_" + module_base_name
     namespace = "::".join(module_name.split(".")[:-1])
@@ -303,19 +427,19 @@ def generate_module(module_name: str, output_dir: str, indent_size: int = 4, max
     pydantic_defs = []
     enum_defs = []
 
-    for clz in (v for v in vars(module).values() if isclass(v) and v.__module__ == module.__name__):
-        if clz is not Enum and issubclass(clz, Enum):
+    for clz in [v for v in vars(module).values() if isinstance(v, type) and v.__module__ == module_name]:
+        if isinstance(clz, EnumType) and clz is not Enum:
             enum_def, pydantic_def = generate_enum(clz, indent_size, max_width)
             enum_defs.append(enum_def)
             pydantic_defs.append(pydantic_def)
         elif is_dataclass(clz) or issubclass(clz, BaseModel):
             struct_def, pydantic_def, struct_includes, struct_usings = \
-                generate_class(clz, indent_size, max_width=max_width)
+                generate_class(clz, indent_size, max_width=max_width, map_type=map_type)
             if struct_def:
                 struct_defs.append(struct_def)
                 pydantic_defs.append(pydantic_def)
-                includes = includes.union(struct_includes)
-                usings = usings.union(struct_usings)
+                includes.update(struct_includes)
+                usings.update(struct_usings)
 
     imports = []
     for include in (i for i in includes if i.startswith('"' + module_root) and include_root not in i):
@@ -326,30 +450,39 @@ def generate_module(module_name: str, output_dir: str, indent_size: int = 4, max
         imprt = ".".join(import_parts)
         imports.append(f"{indent}py::module_::import({imprt});")
 
+    # Sort once, then emit system and other includes ahead of generated headers
+    sorted_includes = sorted(includes)
     includes = [f"#include {i}" for i in
-                chain(sorted(i for i in includes if not i.endswith('.h"')),
-                      sorted(i for i in includes if i.endswith('.h"') and i != self_include))]
+                chain((i for i in sorted_includes if not i.endswith('.h"')),
+                      (i for i in sorted_includes if i.endswith('.h"') and i != self_include))]
 
     usings = [f"using {u};" for u in sorted(usings) if "::".join(u.split("::")[:-1]) != namespace]
 
-    enum_contents = f"\n{double_newline.join(enum_defs)}{single_newline if struct_defs else ''}" if enum_defs else ""
-    struct_contents = f"\n{double_newline.join(struct_defs)}" if struct_defs else ""
     include_contents = f"\n{single_newline.join(includes)}\n" if includes else ""
     using_contents = f"\n{indent}{newline_indent.join(usings)}\n" if includes else ""
     import_contents = f"\n{single_newline.join(imports)}\n" if imports else ""
 
-    header_contents = f"""
+    # The definitions are written out one at a time, rather than first being joined into one string per file
+    with Path(output_dir, f"{module_base_name}.h").open("w") as header_file:
+        header_file.write(f"""
 #ifndef {guard}
 #define {guard}
 {include_contents}
 namespace {namespace}
-{{{using_contents}{enum_contents}{struct_contents}
+{{{using_contents}""")
+
+        if enum_defs or struct_defs:
+            header_file.write(single_newline)
+            __write_definitions(header_file, chain(enum_defs, struct_defs), double_newline)
+
+        header_file.write(f"""
 }} // {namespace}
 
 #endif // {guard}
-"""
+""")
 
-    cpp_contents = f"""
+    with Path(output_dir, f"{module_base_name}.cpp").open("w") as cpp_file:
+        cpp_file.write(f"""
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
 #include <pybind11/chrono.h>
@@ -362,21 +495,41 @@ using namespace {namespace};
 
 PYBIND11_MODULE({qualified_module_name}, m)
 {{{import_contents}
-{double_newline.join(pydantic_defs)}
-}}
-"""
+""")
 
-    with Path(output_dir, f"{module_base_name}.h").open("w") as header_file:
-        header_file.write(header_contents)
+        __write_definitions(cpp_file, pydantic_defs, double_newline)
+        cpp_file.write("""
+}
+""")
 
-    with Path(output_dir, f"{module_base_name}.cpp").open("w") as cpp_file:
-        cpp_file.write(cpp_contents)
+
+def generate_modules(module_names: Iterable[str], output_dir: str, max_workers: Optional[int] = None,
+                     map_type: str = DEFAULT_MAP_TYPE):
+    """
+    Generate C++ and pybind11 code for several modules, each in its own process
+
+    :param module_names: The names of the modules to generate
+    :param output_dir: The directory to write the generated code to
+    :param max_workers: The maximum number of processes to use, defaults to the number of processors
+    :param map_type: The C++ type generated for dict and Mapping fields
+    """
+    module_names = tuple(module_names)
+    if len(module_names) == 1:
+        generate_module(module_names[0], output_dir, map_type=map_type)
+        return
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        # Consume the results, so that any exception raised generating a module is propagated
+        for _ in executor.map(partial(generate_module, output_dir=output_dir, map_type=map_type), module_names):
+            pass
 
 
 if __name__ == "__main__":
     parser = ArgumentParser()
-    parser.add_argument("-m", "--module", type=str, required=True)
+    parser.add_argument("-m", "--module", type=str, nargs="+", required=True)
     parser.add_argument("-o", "--output_dir", type=str, required=True)
+    parser.add_argument("-j", "--jobs", type=int, default=None)
+    parser.add_argument("--map-type", type=str, default=DEFAULT_MAP_TYPE, choices=tuple(__map_type_includes))
     cl_args = parser.parse_args()
 
-    generate_module(cl_args.module, cl_args.output_dir)
+    generate_modules(cl_args.module, cl_args.output_dir, cl_args.jobs, cl_args.map_type)
@@ -0,0 +1,17 @@
+from enum import Enum
+
+from pydantic_bind import BaseModel
+
+
+class Weekday(Enum):
+    MONDAY = 1
+    TUESDAY = 2
+
+
+class Basket(BaseModel):
+    day: Weekday
+    count: int
+    name: str
+    tags: list[str]
+    codes: set[int]
+    counts: dict[str, int] = {}
@@ -0,0 +1,6 @@
+from pydantic_bind import BaseModel
+
+
+class Prices(BaseModel):
+    name: str
+    prices: dict[str, float] = {}
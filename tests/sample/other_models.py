@@ -0,0 +1,8 @@
+from pydantic_bind import BaseModel
+
+from sample.models import Prices
+
+
+class Portfolio(BaseModel):
+    prices: Prices
+    weights: dict[str, float] = {}
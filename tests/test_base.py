@@ -0,0 +1,251 @@
+from dataclasses import FrozenInstanceError
+import pickle
+import sys
+from types import SimpleNamespace
+from typing import Union
+import unittest
+import weakref
+
+from pydantic import BaseModel as PydanticBaseModel, Field
+from pydantic_core import PydanticUndefined
+
+from pydantic_bind import BaseModel, dataclass
+from pydantic_bind.base import field_info_iter
+
+
+class _Impl(SimpleNamespace):
+    # Stands in for a generated pybind class, which applies the field defaults itself
+    def __init__(self, y: int = 2, **kwargs):
+        super().__init__(y=y, **kwargs)
+
+    def to_msg_pack(self):
+        return pickle.dumps(vars(self))
+
+    @classmethod
+    def from_msg_pack(cls, data):
+        return cls(**pickle.loads(data)), 0
+
+
+class Plain(BaseModel):
+    __pybind_type__ = _Impl
+
+    x: int
+
+
+class Custom(BaseModel):
+    __pybind_type__ = _Impl
+
+    x: int
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault("x", 42)
+        super().__init__(**kwargs)
+
+
+class CustomChild(Custom):
+    __pybind_type__ = _Impl
+
+    y: int = 2
+
+
+class PlainChild(Plain):
+    __pybind_type__ = _Impl
+
+    y: int = 2
+
+
+class TestInit(unittest.TestCase):
+    def test_generated_init(self):
+        self.assertTrue(getattr(Plain.__init__, "__pybind_generated__", False))
+        self.assertEqual(Plain.__init__.__module__, __name__)
+        self.assertEqual(Plain(x=1).x, 1)
+        self.assertRaises(RuntimeError, Plain)
+
+    def test_generated_init_is_regenerated_for_subclass(self):
+        self.assertIsNot(PlainChild.__init__, Plain.__init__)
+        child = PlainChild(x=1)
+        self.assertEqual((child.x, child.y), (1, 2))
+
+    def test_custom_init_is_inherited(self):
+        self.assertIs(CustomChild.__init__, Custom.__init__)
+        self.assertEqual(Custom().x, 42)
+        child = CustomChild()
+        self.assertEqual((child.x, child.y), (42, 2))
+
+    def test_model_computed_fields(self):
+        fields = Plain(x=1).model_computed_fields
+        self.assertEqual(list(fields), ["x"])
+        with self.assertRaises(TypeError):
+            del fields["x"]
+        self.assertEqual(list(Plain(x=2).model_computed_fields), ["x"])
+        self.assertIn("x=1", repr(Plain(x=1)))
+
+    def test_from_pybind_impl(self):
+        impl = _Impl(x=5)
+        child = PlainChild.from_pybind_impl(impl)
+        self.assertIs(type(child), PlainChild)
+        self.assertIs(child.pybind_impl, impl)
+        self.assertEqual((child.x, child.y), (5, 2))
+
+        # Reads and writes go through the shared pybind object, in both directions
+        impl.x = 6
+        self.assertEqual(child.x, 6)
+        child.y = 3
+        self.assertEqual(impl.y, 3)
+        self.assertEqual(child.model_dump(), {"x": 6, "y": 3})
+
+    def test_pybind_impl(self):
+        impl = _Impl(x=3)
+        self.assertIs(Plain(__pybind_impl__=impl).pybind_impl, impl)
+        self.assertIs(Custom(__pybind_impl__=impl).pybind_impl, impl)
+
+
+class TestFieldInfo(unittest.TestCase):
+    def test_subclass_and_base(self):
+        # The child is resolved first, so the base must not pick up the child's cached fields
+        self.assertEqual([name for name, _, _ in field_info_iter(PlainChild)], ["x", "y"])
+        self.assertEqual([name for name, _, _ in field_info_iter(Plain)], ["x"])
+        self.assertEqual(field_info_iter(PlainChild)[1], ("y", int, 2))
+
+    def test_dataclass_subclass_and_base(self):
+        self.assertEqual([name for name, _, _ in field_info_iter(SlotsChild)], ["x", "y"])
+        self.assertEqual([name for name, _, _ in field_info_iter(SlotsBase)], ["x"])
+
+    def test_plain_pydantic_subclass_and_base(self):
+        class PlainBase(PydanticBaseModel):
+            x: int
+
+        class PlainSub(PlainBase):
+            y: str = "y"
+
+        self.assertEqual(field_info_iter(PlainSub), (("x", int, PydanticUndefined), ("y", str, "y")))
+        self.assertEqual(field_info_iter(PlainBase), (("x", int, PydanticUndefined),))
+
+    def test_other_types(self):
+        self.assertEqual(field_info_iter(int), ())
+
+
+class Aliased(BaseModel):
+    __pybind_type__ = _Impl
+
+    my_int: int = Field(alias="myInt")
+    my_str: str = "s"
+
+
+class TestJsonSchema(unittest.TestCase):
+    def test_without_aliases(self):
+        schema = PlainChild.model_json_schema()
+        self.assertEqual(schema["required"], ["x"])
+        self.assertEqual(schema["properties"], {"x": {"title": "X", "type": "integer"},
+                                                "y": {"default": 2, "title": "Y", "type": "integer"}})
+
+    def test_with_alias(self):
+        schema = Aliased.model_json_schema()
+        self.assertEqual(schema["required"], ["myInt"])
+        self.assertEqual(set(schema["properties"]), {"myInt", "my_str"})
+        self.assertEqual(schema["properties"]["my_str"], {"default": "s", "title": "My Str", "type": "string"})
+
+
+def _leg_model(pybind_type: type) -> type:
+    # Models sharing a class name, as they would from different modules
+    class Leg(BaseModel):
+        __pybind_type__ = pybind_type
+
+        x: int
+
+    return Leg
+
+
+class _FirstLegImpl(_Impl):
+    pass
+
+
+class _SecondLegImpl(_Impl):
+    pass
+
+
+FirstLeg = _leg_model(_FirstLegImpl)
+SecondLeg = _leg_model(_SecondLegImpl)
+
+
+class Trade(BaseModel):
+    __pybind_type__ = _Impl
+
+    leg: Union[FirstLeg, SecondLeg, int]
+
+
+class TestUnion(unittest.TestCase):
+    def test_same_named_members(self):
+        for leg_type in (FirstLeg, SecondLeg):
+            leg = leg_type(x=1)
+            trade = Trade(leg=leg)
+            self.assertIs(type(trade.leg), leg_type)
+            self.assertEqual(trade.leg.x, 1)
+
+    def test_builtin_member(self):
+        self.assertEqual(Trade(leg=3).leg, 3)
+
+
+@dataclass(slots=True, weakref_slot=True)
+class SlotsBase:
+    __pybind_type__ = _Impl
+
+    x: int
+
+
+@dataclass(slots=True, weakref_slot=True)
+class SlotsChild(SlotsBase):
+    __pybind_type__ = _Impl
+
+    y: int = 2
+
+
+@dataclass(frozen=True, slots=True)
+class FrozenSlots:
+    __pybind_type__ = _Impl
+
+    x: int
+
+
+class _FalsyImpl(_Impl):
+    def __len__(self):
+        return 0
+
+
+class TestDataclassInit(unittest.TestCase):
+    def test_falsy_pybind_impl(self):
+        impl = _FalsyImpl(x=7)
+        self.assertIs(SlotsBase(__pybind_impl__=impl).pybind_impl, impl)
+        self.assertIs(Plain(__pybind_impl__=impl).pybind_impl, impl)
+
+
+class TestDataclassSlots(unittest.TestCase):
+    def test_slots(self):
+        self.assertEqual(SlotsBase.__slots__, ("_pybind_impl", "__weakref__"))
+        self.assertEqual(FrozenSlots.__slots__, ("_pybind_impl",))
+        self.assertFalse(hasattr(SlotsBase(1), "__dict__"))
+
+    def test_subclass_slots(self):
+        # The base already provides both slots, so declaring them again would duplicate the members
+        self.assertEqual(SlotsChild.__slots__, ())
+        child = SlotsChild(1)
+        self.assertEqual(sys.getsizeof(child), sys.getsizeof(SlotsBase(1)))
+        self.assertFalse(hasattr(child, "__dict__"))
+        self.assertIs(weakref.ref(child)(), child)
+        self.assertEqual((child.x, child.y), (1, 2))
+
+    def test_frozen_round_trip(self):
+        frozen = FrozenSlots(3)
+        self.assertRaises(FrozenInstanceError, setattr, frozen, "x", 4)
+        self.assertEqual(FrozenSlots(__pybind_impl__=frozen.pybind_impl), frozen)
+        self.assertEqual(FrozenSlots.from_msg_pack(frozen.to_msg_pack()), frozen)
+
+    def test_slots_round_trip(self):
+        child = SlotsChild(1, 5)
+        copy = SlotsChild.from_msg_pack(child.to_msg_pack())
+        self.assertIsNot(copy.pybind_impl, child.pybind_impl)
+        self.assertEqual(copy, child)
+
+
+if __name__ == "__main__":
+    unittest.main()
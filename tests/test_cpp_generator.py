@@ -0,0 +1,81 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import unittest
+
+from pydantic_bind.cpp_generator import DEFAULT_MAP_TYPE, class_attrs, cpp_type, generate_class, generate_module, \
+    generate_modules
+
+from sample.containers import Basket
+from sample.models import Prices
+
+
+class TestMapType(unittest.TestCase):
+    def test_default(self):
+        self.assertEqual(DEFAULT_MAP_TYPE, "std::unordered_map")
+        typ, includes, _ = cpp_type(dict[str, float])
+        self.assertEqual(typ, "std::unordered_map<std::string, double>")
+        self.assertIn("<unordered_map>", includes)
+
+    def test_map(self):
+        typ, includes, _ = cpp_type(dict[str, list[int]], "std::map")
+        self.assertEqual(typ, "std::map<std::string, std::vector<int>>")
+        self.assertIn("<map>", includes)
+        self.assertNotIn("<unordered_map>", includes)
+
+        struct_def, _, struct_includes, _ = generate_class(Prices, map_type="std::map")
+        self.assertIn("std::map<std::string, double> prices;", struct_def)
+        self.assertIn("<map>", struct_includes)
+
+    def test_dict_value_type(self):
+        struct_def, _, _, _ = generate_class(Basket)
+        self.assertIn("std::unordered_map<std::string, int> counts;", struct_def)
+
+    def test_unsupported(self):
+        self.assertRaises(RuntimeError, cpp_type, dict[str, float], "absl::flat_hash_map")
+        self.assertRaises(RuntimeError, generate_class, Prices, map_type="absl::flat_hash_map")
+
+
+class TestClassAttrs(unittest.TestCase):
+    def test_move(self):
+        # Enums and builtins such as int are copied, everything else is moved into the members
+        init_args = class_attrs(Basket).init_args
+        self.assertIn("day(day)", init_args)
+        self.assertIn("count(count)", init_args)
+        self.assertIn("name(std::move(name))", init_args)
+        self.assertIn("tags(std::move(tags))", init_args)
+
+
+class TestGenerateModule(unittest.TestCase):
+    def test_includes(self):
+        with TemporaryDirectory() as output_dir:
+            generate_module("sample.containers", output_dir)
+            header = Path(output_dir, "containers.h").read_text()
+
+        includes = [line for line in header.splitlines() if line.startswith("#include")]
+        self.assertEqual(includes, ["#include <set>",
+                                    "#include <string>",
+                                    "#include <unordered_map>",
+                                    "#include <vector>",
+                                    '#include "msgpack/msgpack.h"'])
+
+
+class TestGenerateModules(unittest.TestCase):
+    def test_generate_modules(self):
+        with TemporaryDirectory() as output_dir:
+            generate_modules(("sample.models", "sample.other_models"), output_dir, max_workers=2, map_type="std::map")
+            generated = sorted(p.name for p in Path(output_dir).iterdir())
+            self.assertEqual(generated, ["models.cpp", "models.h", "other_models.cpp", "other_models.h"])
+
+            header = Path(output_dir, "other_models.h").read_text()
+            self.assertIn("std::map<std::string, double> weights;", header)
+            self.assertIn('#include "sample/models.h"', header)
+
+    def test_unsupported_map_type(self):
+        with TemporaryDirectory() as output_dir:
+            self.assertRaises(RuntimeError, generate_modules, ("sample.models",), output_dir,
+                              map_type="absl::flat_hash_map")
+            self.assertFalse(any(Path(output_dir).iterdir()))
+
+
+if __name__ == "__main__":
+    unittest.main()